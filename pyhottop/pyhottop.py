@@ -13,27 +13,25 @@ Marko Luther is listed in the credits here for his amazing work on Artisan. His
 application originally inspired the creation of this module and was helpful for
 understanding how to interface with the Hottop roaster serial interface.
 """
-import binascii
+import atexit
 import copy
 import datetime
-import glob
 import logging
+import numpy as np
+import os
 import serial
+import struct
 import sys
 import time
 from scipy.stats import linregress
+from serial.tools import list_ports
 from threading import Thread, Event
 from collections import deque
+from logging.handlers import QueueHandler
+from queue import Empty, Full, Queue
 
 from .mock import MockProcess
 
-py2 = sys.version[0] == '2'
-
-if py2:
-    from Queue import Queue
-else:
-    from queue import Queue
-
 __author__ = "Brandon Dixon"
 __copyright__ = "Copyright, Split Key Coffee"
 __credits__ = ["Brandon Dixon", "Marko Luther"]
@@ -58,17 +56,100 @@ class SerialConnectionError(Exception):
     pass
 
 
-def bool2int(bool):
-    """Convert a bool to an int."""
-    if bool:
-        return 1
-    else:
-        return 0
+class LogListener:
 
+    """Write queued log records out to handlers from a background thread.
 
-def hex2int(value):
-    """Convert hex to an int."""
-    return int(binascii.hexlify(value), 16)
+    The listener can be started and stopped repeatedly. Stopping it waits for
+    the queue to empty, so nothing queued before the stop is lost.
+
+    :param queue: Queue shared with the logging handler
+    :type queue: Queue instance
+    :param handlers: Handlers to write records out to
+    :type handlers: Handler instances
+    """
+
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, queue, *handlers):
+        """Set up the listener without starting it."""
+        self.queue = queue
+        self.handlers = handlers
+        self._worker = None
+        self._stopping = Event()
+
+    def start(self):
+        """Start the listener thread unless it's already running."""
+        if self._worker is not None:
+            return
+        self._stopping.clear()
+        self._worker = Thread(target=self._monitor)
+        self._worker.daemon = True
+        self._worker.start()
+
+    def stop(self):
+        """Stop the listener thread, writing out anything still queued."""
+        if self._worker is not None:
+            self._stopping.set()
+            self._worker.join()
+            self._worker = None
+        self._drain()
+
+    def handle(self, record):
+        """Pass a record to each handler that accepts its level."""
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _drain(self):
+        """Write out every record currently in the queue."""
+        while True:
+            try:
+                record = self.queue.get_nowait()
+            except Empty:
+                return
+            self.handle(record)
+
+    def _monitor(self):
+        """Write records out until stopped and the queue is empty."""
+        while True:
+            try:
+                record = self.queue.get(timeout=self.POLL_INTERVAL)
+            except Empty:
+                if self._stopping.is_set():
+                    return
+                continue
+            self.handle(record)
+
+
+class BoundedQueueHandler(QueueHandler):
+
+    """Queue handler that drops the oldest records instead of blocking.
+
+    :param queue: Bounded queue shared with the listener
+    :type queue: Queue instance
+    :param handlers: Handlers the listener writes records out to
+    :type handlers: Handler instances
+    """
+
+    def __init__(self, queue, *handlers):
+        """Pair the handler with a listener draining the same queue."""
+        QueueHandler.__init__(self, queue)
+        self.listener = LogListener(queue, *handlers)
+
+    def enqueue(self, record):
+        """Add the record to the queue, making room if it's full."""
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            try:
+                self.queue.get_nowait()
+            except Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+            except Full:
+                pass
 
 
 def celsius2fahrenheit(c):
@@ -117,10 +198,8 @@ class ControlProcess(Thread):
 
     :param conn: Established serial connection to the Hottop
     :type conn: Serial instance
-    :param config: Initial configurations settings
+    :param config: Configuration settings shared with the user interface
     :type config: dict
-    :param q: Shared queue to interact with the user interface
-    :type q: Queue instance
     :param logger: Shared logger to keep continuity
     :type logger: Logging instance
     :param callback: Optional callback function to stream results
@@ -130,16 +209,27 @@ class ControlProcess(Thread):
 
     MAX_BOUND_TEMP = 500
     MIN_BOUND_TEMP = 50
-
-    def __init__(self, conn, config, q, logger, callback=None):
+    READ_ATTEMPTS = 4
+    FRAME_HEADER = b'\xA5\x96'
+    FRAME_LENGTH = 36
+    # heater, fan, main_fan, solenoid, drum_motor, cooling_motor, chaff_tray,
+    # environment_temp, bean_temp and checksum from a frame.
+    FRAME_STRUCT = struct.Struct('>10x3B3x4B3x2H8xB')
+
+    # Static portion of the configuration; only the controls change per write.
+    CONFIG_TEMPLATE = (bytes([0xA5, 0x96, 0xB0, 0xA0, 0x01, 0x01, 0x24]) +
+                       bytes(29))
+    CONFIG_TEMPLATE_SUM = sum(CONFIG_TEMPLATE)
+
+    def __init__(self, conn, config, logger, callback=None):
         """Extend threads to support more control logic."""
         Thread.__init__(self)
+        # Don't keep the interpreter alive if the user never calls end()
+        self.daemon = True
         self._conn = conn
         self._log = logger
         self._config = config
-        self._q = q
         self._cb = callback
-        self._retry_count = 0
 
         # Trigger events used in the core loop.
         self.cooldown = Event()
@@ -150,48 +240,66 @@ class ControlProcess(Thread):
 
         Configuration settings need to be represented inside of a byte array
         that is then written to the serial interface. Much of the configuration
-        is static, but control settings are also included and pulled from the
-        shared dictionary.
+        is static and copied from `CONFIG_TEMPLATE`, but control settings are
+        also included and pulled from the shared dictionary. The checksum only
+        needs to add the controls to the pre-computed template sum.
 
         :returns: Byte array of the prepared configuration.
         """
-        config = bytearray([0x00] * 36)
-        config[0] = 0xA5
-        config[1] = 0x96
-        config[2] = 0xB0
-        config[3] = 0xA0
-        config[4] = 0x01
-        config[5] = 0x01
-        config[6] = 0x24
+        config = bytearray(self.CONFIG_TEMPLATE)
         config[10] = self._config.get('heater', 0)
         config[11] = self._config.get('fan', 0)
         config[12] = self._config.get('main_fan', 0)
         config[16] = self._config.get('solenoid', 0)
         config[17] = self._config.get('drum_motor', 0)
-        if self._config.get('heater', 0) > 0:
+        if config[10] > 0:
             # Override the user here since the drum MUST be on for heat
             config[17] = 1
         config[18] = self._config.get('cooling_motor', 0)
-        config[35] = sum([b for b in config[:35]]) & 0xFF
+        config[35] = (self.CONFIG_TEMPLATE_SUM + config[10] + config[11] +
+                      config[12] + config[16] + config[17] +
+                      config[18]) & 0xFF
         return bytes(config)
 
-    def _send_config(self):
+    def _send_config(self, serialized=None):
         """Send configuration data to the hottop.
 
+        :param serialized: Prepared configuration, generated if not passed
+        :type serialized: bytes
         :returns: bool
         :raises: Generic exceptions if an error is identified.
         """
-        serialized = self._generate_config()
-        self._log.debug("Configuration has been serialized")
+        if serialized is None:
+            serialized = self._generate_config()
+            self._log.debug("Configuration has been serialized")
         try:
-            self._conn.flushInput()
-            self._conn.flushOutput()
             self._conn.write(serialized)
             return True
         except Exception as e:
+            if self.exit.is_set():
+                # The port was closed on shutdown, so there's nothing to send
+                return False
             self._log.error(e)
             raise Exception(e)
 
+    def _reopen(self):
+        """Close and reopen the serial connection after a failure.
+
+        Nothing is done once shutdown has been requested, since the port may
+        have been closed intentionally.
+
+        :returns: bool
+        """
+        if self.exit.is_set():
+            return False
+        self._conn.close()
+        try:
+            self._conn.open()
+        except serial.SerialException as e:
+            self._log.error("Unable to reopen connection: %s", e)
+            return False
+        return True
+
     def _validate_checksum(self, buffer):
         """Validate the buffer response against the checksum.
 
@@ -201,75 +309,94 @@ class ControlProcess(Thread):
         :returns: bool
         """
         self._log.debug("Validating the buffer")
-        if len(buffer) == 0:
-            self._log.debug("Buffer was empty")
-            if self._conn.isOpen():
-                self._log.debug('Closing connection')
-                self._conn.close()
+        if len(buffer) != self.FRAME_LENGTH:
+            self._log.debug("Buffer was incomplete")
             return False
-        p0 = hex2int(buffer[0])
-        p1 = hex2int(buffer[1])
-        checksum = sum([hex2int(c) for c in buffer[:35]]) & 0xFF
-        p35 = hex2int(buffer[35])
-        if p0 != 165 or p1 != 150 or p35 != checksum:
+        if buffer[0] != 0xA5 or buffer[1] != 0x96:
+            self._log.debug("Buffer header was not valid")
+            return False
+        if (sum(buffer[:35]) & 0xFF) != buffer[35]:
             self._log.debug("Buffer checksum was not valid")
             return False
         return True
 
-    def _read_settings(self, retry=True):
+    def _read_frame(self):
+        """Read a single frame from the serial interface.
+
+        The roaster streams frames continuously, so anything already waiting
+        on the interface is read and the most recent complete frame in it that
+        passes the checksum is used. Only if there is none do we complete a
+        trailing partial frame from the interface. When nothing usable is
+        waiting, we skip ahead to the next frame header and read the remainder
+        of that frame instead.
+
+        :returns: bytes, empty if no header was found before the timeout
+        """
+        pending = self._conn.read(self._conn.in_waiting)
+        partial = None
+        start = pending.rfind(self.FRAME_HEADER)
+        while start > -1:
+            frame = pending[start:start + self.FRAME_LENGTH]
+            if len(frame) < self.FRAME_LENGTH:
+                partial = frame
+            elif self._validate_checksum(frame):
+                return frame
+            start = pending.rfind(self.FRAME_HEADER, 0, start)
+        if partial is not None:
+            return partial + self._conn.read(self.FRAME_LENGTH - len(partial))
+        header = self._conn.read_until(self.FRAME_HEADER,
+                                       self.FRAME_LENGTH * 4)
+        if not header.endswith(self.FRAME_HEADER):
+            self._log.debug("Frame header was not found")
+            return bytes()
+        body = self._conn.read(self.FRAME_LENGTH - len(self.FRAME_HEADER))
+        return self.FRAME_HEADER + body
+
+    def _read_settings(self):
         """Read the information from the Hottop.
 
         Read the settings from the serial interface and convert them into a
         human-readable format that can be shared back to the end-user. Reading
         from the serial interface will occasionally produce strange results or
-        blank reads, so a retry process has been built into the function as a
-        recursive check.
+        blank reads, so the read is attempted up to `READ_ATTEMPTS` times
+        before giving up on the poll.
 
-        :returns: dict
+        :returns: dict or None if no valid buffer was read
         """
-        if not self._conn.isOpen():
-            self._log.debug("Reopening connection")
-            self._conn.open()
-        self._conn.flushInput()
-        self._conn.flushOutput()
-        buffer = self._conn.read(36)
-        if len(buffer) != 36:
-            self._log.debug('Buffer length (%d) did not match 36' % len(buffer))
-            if self._conn.isOpen():
-                self._log.debug('Closing connection')
-                self._conn.close()
-                self._read_settings(retry=True)
-
-        try:
-            check = self._validate_checksum(buffer)
-        except:
-            check = False
-
-        if not check and (retry and self._retry_count <= 3):
-            if self._retry_count == 3:
-                self._log.error('Retry count reached on buffer check')
-                self._read_settings(retry=False)
-            else:
-                self._retry_count += 1
-                self._read_settings(retry=True)
+        for _ in range(self.READ_ATTEMPTS):
+            try:
+                buffer = self._read_frame()
+            except serial.SerialException as e:
+                if self.exit.is_set():
+                    # The port was closed on shutdown, so leave it closed
+                    return None
+                self._log.error("Serial read failed, reopening: %s", e)
+                self._reopen()
+                continue
+            if len(buffer) != self.FRAME_LENGTH:
+                self._log.debug('Buffer length (%d) did not match %d',
+                                len(buffer), self.FRAME_LENGTH)
+                continue
+            if self._validate_checksum(buffer):
+                break
+        else:
+            self._log.error('Retry count reached on buffer check')
+            return None
 
-        try:
-            settings = dict()
-            settings['heater'] = hex2int(buffer[10])
-            settings['fan'] = hex2int(buffer[11])
-            settings['main_fan'] = hex2int(buffer[12])
-            et = hex2int(buffer[23] + buffer[24])
-            settings['environment_temp'] = celsius2fahrenheit(et)
-            bt = hex2int(buffer[25] + buffer[26])
-            settings['bean_temp'] = celsius2fahrenheit(bt)
-            settings['solenoid'] = hex2int(buffer[16])
-            settings['drum_motor'] = hex2int(buffer[17])
-            settings['cooling_motor'] = hex2int(buffer[18])
-            settings['chaff_tray'] = hex2int(buffer[19])
-            self._retry_count = 0
-        except Exception:
-            self._log.error("Pulled a cache configuration!")
-            settings = self._generate_config()
+        (heater, fan, main_fan, solenoid, drum_motor, cooling_motor,
+         chaff_tray, et, bt, _) = self.FRAME_STRUCT.unpack(buffer)
+        settings = dict()
+        settings['heater'] = heater
+        settings['fan'] = fan
+        settings['main_fan'] = main_fan
+        settings['environment_temp_raw'] = et
+        settings['environment_temp'] = celsius2fahrenheit(et)
+        settings['bean_temp_raw'] = bt
+        settings['bean_temp'] = celsius2fahrenheit(bt)
+        settings['solenoid'] = solenoid
+        settings['drum_motor'] = drum_motor
+        settings['cooling_motor'] = cooling_motor
+        settings['chaff_tray'] = chaff_tray
         return settings
 
     def _valid_config(self, settings):
@@ -296,29 +423,57 @@ class ControlProcess(Thread):
                 return False
         return True
 
+    def _raise_priority(self):
+        """Attempt to run the control thread at a higher priority.
+
+        Reading and writing the roaster is time sensitive, so this is a
+        best-effort renice. On Windows only this thread is raised. Elsewhere
+        `os.nice` is used, which affects just the calling thread on Linux but
+        the whole process on macOS and BSD. Raising the priority usually needs
+        elevated permissions and is skipped if the request is refused.
+
+        :returns: bool
+        """
+        try:
+            if sys.platform.startswith('win'):
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                # THREAD_PRIORITY_HIGHEST
+                return bool(kernel32.SetThreadPriority(
+                    kernel32.GetCurrentThread(), 2))
+            os.nice(-5)
+            return True
+        except (AttributeError, OSError):
+            self._log.debug("Unable to raise the thread priority")
+            return False
+
     def _wake_up(self):
         """Wake the machine up to avoid race conditions.
 
         When first interacting with the Hottop, the machine may not wake up
         right away which can put our reader into a death loop. This wake up
         routine ensures we prime the roaster with some data before starting
-        our main loops to read/write data.
+        our main loops to read/write data. A shutdown request stops the
+        routine early.
 
         :returns: None
         """
-        for range in (0, 10):
+        for _ in range(10):
+            if self.exit.is_set():
+                return
             self._send_config()
-            time.sleep(self._config['interval'])
+            self.exit.wait(self._config['interval'])
 
     def run(self):
         """Run the core loop of reading and writing configurations.
 
         This is where all the roaster magic occurs. On the initial run, we
-        prime the roaster with some data to wake it up. Once awoke, we check
-        our shared queue to identify if the user has passed any updated
-        configuration. Once checked, start to read and write to the Hottop
-        roaster as long as the exit signal has not been set. All steps are
-        repeated after waiting for a specific time interval.
+        prime the roaster with some data to wake it up. Once awoke, start to
+        read and write to the Hottop roaster as long as the exit signal has
+        not been set. The configuration dictionary is shared with the user
+        interface, so any control changes are picked up on the next write. All
+        steps are repeated every time interval, measured from the start of each
+        pass so slow serial reads don't stretch the polling period.
 
         There are also specialized routines built into this function that are
         controlled via events. These events are unique to the roasting process
@@ -327,16 +482,11 @@ class ControlProcess(Thread):
 
         :returns: None
         """
+        self._raise_priority()
         self._wake_up()
 
-        while not self._q.empty():
-            self._config = self._q.get()
-
+        deadline = time.monotonic()
         while not self.exit.is_set():
-            settings = self._read_settings()
-            settings['valid'] = self._valid_config(settings)
-            self._cb(settings)
-
             if self.cooldown.is_set():
                 self._log.debug("Cool down process triggered")
                 self._config['drum_motor'] = 1
@@ -345,10 +495,22 @@ class ControlProcess(Thread):
                 self._config['cooling_motor'] = 1
                 self._config['main_fan'] = 10
 
-            if settings['valid']:
-                self._log.debug("Settings were valid, sending...")
-                self._send_config()
-            time.sleep(self._config['interval'])
+            # Prepare the write up front so it goes out right after the read
+            serialized = self._generate_config()
+            settings = self._read_settings()
+            if settings is not None:
+                settings['valid'] = self._valid_config(settings)
+                if settings['valid']:
+                    self._log.debug("Settings were valid, sending...")
+                    self._send_config(serialized)
+                self._cb(settings)
+
+            deadline += self._config['interval']
+            delay = deadline - time.monotonic()
+            if delay < 0:
+                # Fell behind, so start the schedule over instead of bursting
+                deadline, delay = time.monotonic(), 0
+            self.exit.wait(delay)
 
     def drop(self):
         """Register a drop event to begin the cool-down process.
@@ -376,13 +538,27 @@ class Hottop:
 
     NAME = "HOTTOP"
     USB_PORT = "/dev/cu.usbserial-DA01PEYC"
+    USB_VID = 0x0403
+    USB_PID = 0x6001
     BAUDRATE = 115200
     BYTE_SIZE = 8
     PARITY = "N"
     STOPBITS = 1
-    TIMEOUT = 1
+    TIMEOUT = 0.05
     LOG_LEVEL = logging.DEBUG
+    LOG_QUEUE_SIZE = 1024
     INTERVAL = 0.6
+    READINGS_SIZE = 4096
+    READING_DTYPE = np.dtype([('time', 'f4'),
+                              ('environment_temp_raw', 'u2'),
+                              ('bean_temp_raw', 'u2'),
+                              ('heater', 'u1'),
+                              ('fan', 'u1'),
+                              ('main_fan', 'u1'),
+                              ('solenoid', 'u1'),
+                              ('drum_motor', 'u1'),
+                              ('cooling_motor', 'u1'),
+                              ('chaff_tray', 'u1')])
 
     def __init__(self):
         """Start of the hottop."""
@@ -395,52 +571,64 @@ class Hottop:
         self._roast_end = None
         self._config = dict()
         self._window = deque(list(), 5)
-        self._q = Queue()
         self._init_controls()
 
     def _logger(self):
         """Create a logger to be used between processes.
 
+        Records are passed through a bounded queue and written out by a
+        separate listener thread. If the output can't keep up, the oldest
+        records are dropped rather than holding up the caller. The handler is
+        only attached once per logger and anything still queued is written
+        out when the process exits.
+
         :returns: Logging instance.
         """
         logger = logging.getLogger(self.NAME)
         logger.setLevel(self.LOG_LEVEL)
+        for handler in logger.handlers:
+            if isinstance(handler, BoundedQueueHandler):
+                self._log_listener = handler.listener
+                self._log_listener.start()
+                return logger
         shandler = logging.StreamHandler(sys.stdout)
         fmt = '\033[1;32m%(levelname)-5s %(module)s:%(funcName)s():'
         fmt += '%(lineno)d %(asctime)s\033[0m| %(message)s'
         shandler.setFormatter(logging.Formatter(fmt))
-        logger.addHandler(shandler)
+        # Writes to stdout happen on the listener thread, so the control
+        # thread never blocks on a slow terminal.
+        qhandler = BoundedQueueHandler(Queue(maxsize=self.LOG_QUEUE_SIZE),
+                                       shandler)
+        self._log_listener = qhandler.listener
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        logger.addHandler(qhandler)
         return logger
 
     def _autodiscover_usb(self):
         """Attempt to find the serial adapter for the hottop.
 
-        This will loop over the USB serial interfaces looking for a connection
-        that appears to match the naming convention of the Hottop roaster.
+        This will ask the OS for the available serial ports and look for the
+        USB vendor and product IDs of the adapter used by the Hottop roaster.
+        If none match, fall back to a port that appears to match the naming
+        convention of the Hottop roaster.
 
         :returns: string
         """
-        if sys.platform.startswith('win'):
-            ports = ['COM%s' % (i + 1) for i in range(256)]
-        elif sys.platform.startswith('linux') or sys.platform.startswith('cygwin'):
-            ports = glob.glob('/dev/tty[A-Za-z]*')
-        elif sys.platform.startswith('darwin'):
-            ports = glob.glob('/dev/cu.*')
-        else:
-            raise EnvironmentError('Unsupported platform')
-
+        ports = list_ports.comports()
         match = None
         for port in ports:
-            try:
-                s = serial.Serial(port)
-                s.close()
-                if (port.find("/dev/cu.usbserial-") > -1 and
-                        port.find('bluetooth') == -1):
-                    self.USB_PORT = port
-                    match = port
+            if port.vid == self.USB_VID and port.pid == self.USB_PID:
+                match = port.device
+                break
+        else:
+            for port in ports:
+                if (port.device.find("/dev/cu.usbserial-") > -1 and
+                        port.device.find('bluetooth') == -1):
+                    match = port.device
                     break
-            except (OSError, serial.SerialException):
-                pass
+        if match:
+            self.USB_PORT = match
         return match
 
     def connect(self, interface=None):
@@ -456,7 +644,7 @@ class Hottop:
             return True
         if not interface:
             match = self._autodiscover_usb()
-            self._log.debug("Auto-discovered USB port: %s" % match)
+            self._log.debug("Auto-discovered USB port: %s", match)
         else:
             self.USB_PORT = interface
 
@@ -505,6 +693,9 @@ class Hottop:
         self._roast['charge'] = None
         self._roast['turning_point'] = None
 
+        self._readings = np.empty(self.READINGS_SIZE, dtype=self.READING_DTYPE)
+        self._reading_count = 0
+
     def _callback(self, data):
         """Processor callback to clean-up stream data.
 
@@ -536,6 +727,8 @@ class Hottop:
             self._derive_charge(copied['config'])
             self._derive_turning_point(copied['config'])
             self._roast['events'].append(copied)
+            if local.get('valid', True):
+                self._record_reading(local)
 
             if self._roast['last']:
                 delta = local['bean_temp'] - self._roast['last']['bean_temp']
@@ -549,6 +742,24 @@ class Hottop:
             if local.get('valid', True):
                 self._user_callback(output)
 
+    def _record_reading(self, config):
+        """Save a reading into the structured roast log.
+
+        The log is pre-allocated and doubled in size whenever it fills up, so
+        readings are stored compactly and can be analyzed as numpy columns.
+
+        :param config: Current snapshot of the configuration
+        :type config: dict
+        :returns: None
+        """
+        if self._reading_count == len(self._readings):
+            grown = np.empty(len(self._readings) * 2, dtype=self.READING_DTYPE)
+            grown[:self._reading_count] = self._readings
+            self._readings = grown
+        self._readings[self._reading_count] = tuple(
+            config[name] for name in self.READING_DTYPE.names)
+        self._reading_count += 1
+
     def _derive_charge(self, config):
         """Use a temperature window to identify the roast charge.
 
@@ -607,33 +818,48 @@ class Hottop:
         This function will kick off the processing thread for the Hottop and
         register any user-defined callback function. By default, it will not
         begin collecting any reading information or saving it. In order to do
-        that users, must issue the monitor/record bit via `set_monitor`.
+        that users, must issue the monitor/record bit via `set_monitor`. If a
+        previous `end` closed the serial connection, it's reopened here.
 
         :param func: Callback function for Hottop stream data
         :type func: function
         :returns: None
+        :raises SerialConnectionError:
         """
         self._user_callback = func
         if not self._simulate:
-            self._process = ControlProcess(self._conn, self._config, self._q,
-                                           self._log, callback=self._callback)
+            if not self._conn.isOpen():
+                try:
+                    self._conn.open()
+                except serial.SerialException as e:
+                    raise SerialConnectionError(str(e))
+                self._log.debug("Serial connection reopened")
+            self._process = ControlProcess(self._conn, self._config, self._log,
+                                           callback=self._callback)
         else:
-            self._process = MockProcess(self._config, self._q,
-                                        self._log, callback=self._callback)
+            self._process = MockProcess(self._config, self._log,
+                                        callback=self._callback)
+        self._log_listener.start()
         self._process.start()
         self._roasting = True
 
     def end(self):
         """End the roaster control process via thread signal.
 
-        This simply sends an exit signal to the thread, and shuts it down. In
-        order to stop monitoring, call the `set_monitor` method with false.
+        This sends an exit signal to the thread, waits briefly for it to
+        finish, closes the serial connection and writes out any queued log
+        records. In order to stop monitoring, call the `set_monitor` method
+        with false.
 
         :returns: None
         """
         self._process.shutdown()
+        self._process.join(timeout=self._config['interval'] * 2 + 1)
+        if self._conn:
+            self._conn.close()
         self._roasting = False
         self._roast['date'] = now_date(str=True)
+        self._log_listener.stop()
 
     def drop(self):
         """Preset call to drop coffee from the roaster via thread signal.
@@ -716,6 +942,29 @@ class Hottop:
         td = (now_time() - load_time(self._roast_start))
         return ((td.total_seconds() + 60) / 60) - 1
 
+    def get_roast_readings(self):
+        """Get the recorded roast readings.
+
+        :returns: numpy structured array using `READING_DTYPE`
+        """
+        return self._readings[:self._reading_count]
+
+    def get_roast_temperatures(self):
+        """Get the recorded roast temperatures in fahrenheit.
+
+        Readings keep the raw celsius values reported by the roaster, so the
+        whole roast can be converted in a single pass instead of working with
+        the per-reading values.
+
+        :returns: dict of numpy arrays keyed by temperature name
+        """
+        readings = self.get_roast_readings()
+        return {
+            'environment_temp': celsius2fahrenheit(
+                readings['environment_temp_raw']),
+            'bean_temp': celsius2fahrenheit(readings['bean_temp_raw'])
+        }
+
     def get_serial_state(self):
         """Get the state of the USB connection.
 
@@ -743,9 +992,10 @@ class Hottop:
         :returns: None
         :raises: InvalidInput
         """
-        if type(interval) != float or type(interval) != int:
-            raise InvalidInput("Interval value must be of float or int")
-        self._config['interval']
+        if (isinstance(interval, bool) or
+                not isinstance(interval, (int, float)) or interval <= 0):
+            raise InvalidInput("Interval value must be a positive float or int")
+        self._config['interval'] = float(interval)
 
     def get_roast_properties(self):
         """Get the roast properties.
@@ -762,7 +1012,7 @@ class Hottop:
         :returns: None
         :raises: InvalidInput
         """
-        if type(settings) != dict:
+        if not isinstance(settings, dict):
             raise InvalidInput("Properties value must be of dict")
         valid = ['name', 'input_weight', 'output_weight', 'operator', 'notes',
                  'coffee']
@@ -791,10 +1041,9 @@ class Hottop:
         :returns: None
         :raises: InvalidInput
         """
-        if type(monitor) != bool:
+        if not isinstance(monitor, bool):
             raise InvalidInput("Monitor value must be bool")
-        self._roast['record'] = bool2int(monitor)
-        self._q.put(self._config)
+        self._roast['record'] = int(monitor)
 
         if self._roast['record']:
             self._roast_start = now_time(str=True)
@@ -823,10 +1072,10 @@ class Hottop:
         :returns: None
         :raises: InvalidInput
         """
-        if type(heater) != int and heater not in range(0, 101):
+        if (not isinstance(heater, int) or isinstance(heater, bool) or
+                not 0 <= heater <= 100):
             raise InvalidInput("Heater value must be int between 0-100")
         self._config['heater'] = heater
-        self._q.put(self._config)
 
     def get_fan(self):
         """Get the fan config.
@@ -843,10 +1092,10 @@ class Hottop:
         :returns: None
         :raises: InvalidInput
         """
-        if type(fan) != int and fan not in range(0, 11):
+        if (not isinstance(fan, int) or isinstance(fan, bool) or
+                not 0 <= fan <= 10):
             raise InvalidInput("Fan value must be int between 0-10")
         self._config['fan'] = fan
-        self._q.put(self._config)
 
     def get_main_fan(self):
         """Get the main fan config.
@@ -863,10 +1112,10 @@ class Hottop:
         :returns: None
         :raises: InvalidInput
         """
-        if type(main_fan) != int and main_fan not in range(0, 11):
+        if (not isinstance(main_fan, int) or isinstance(main_fan, bool) or
+                not 0 <= main_fan <= 10):
             raise InvalidInput("Main fan value must be int between 0-10")
         self._config['main_fan'] = main_fan
-        self._q.put(self._config)
 
     def get_drum_motor(self):
         """Get the drum motor config.
@@ -883,11 +1132,10 @@ class Hottop:
         :returns: None
         :raises: InvalidInput
         """
-        if type(drum_motor) != bool:
+        if not isinstance(drum_motor, bool):
             raise InvalidInput("Drum motor value must be bool")
-        self._config['drum_motor'] = bool2int(drum_motor)
-        self._log.debug(self._config)
-        self._q.put(self._config)
+        self._config['drum_motor'] = int(drum_motor)
+        self._log.debug("Updated config: %s", self._config)
 
     def get_solenoid(self):
         """Get the solenoid config.
@@ -904,10 +1152,9 @@ class Hottop:
         :returns: None
         :raises: InvalidInput
         """
-        if type(solenoid) != bool:
+        if not isinstance(solenoid, bool):
             raise InvalidInput("Solenoid value must be bool")
-        self._config['solenoid'] = bool2int(solenoid)
-        self._q.put(self._config)
+        self._config['solenoid'] = int(solenoid)
 
     def get_cooling_motor(self):
         """Get the cooling motor config.
@@ -924,10 +1171,9 @@ class Hottop:
         :returns: None
         :raises: InvalidInput
         """
-        if type(cooling_motor) != bool:
+        if not isinstance(cooling_motor, bool):
             raise InvalidInput("Cooling motor value must be bool")
-        self._config['cooling_motor'] = bool2int(cooling_motor)
-        self._q.put(self._config)
+        self._config['cooling_motor'] = int(cooling_motor)
 
     def get_simulate(self):
         """Get the simulation status.
@@ -944,6 +1190,6 @@ class Hottop:
         :returns: None
         :raises: InvalidInput
         """
-        if type(status) != bool:
+        if not isinstance(status, bool):
             raise InvalidInput("Status value must be bool")
-        self._simulate = bool2int(status)
+        self._simulate = int(status)
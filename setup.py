@@ -15,7 +15,8 @@ setup(
     author_email="brandon@splitkeycoffee.com",
     license="MIT",
     packages=find_packages(),
-    install_requires=['pyserial'],
+    install_requires=['numpy>=1.14.5', 'pyserial>=3.0', 'scipy>=1.1.0'],
+    python_requires='>=3.7',
     long_description=read('README.rst'),
     classifiers=[
         'Development Status :: 4 - Beta',
@@ -23,6 +24,7 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Natural Language :: English',
         'Programming Language :: Python',
+        'Programming Language :: Python :: 3',
         'Topic :: Software Development :: Libraries'
     ],
     package_data={